@@ -6,8 +6,112 @@ Generates DarkRP job definitions based on user input
 
 import json
 import os
+import sys
 from datetime import datetime
 
+# True when answers are fed from a file or pipe instead of a terminal
+STDIN_PIPED = sys.stdin is not None and not sys.stdin.isatty()
+
+BAR = "=" * 50
+
+# Largest value the engine accepts for integer job/player stats
+INT32_MAX = 2**31 - 1
+
+MENU = "\n".join([
+    "",
+    BAR,
+    "DARKRP JOB GENERATOR",
+    BAR,
+    "1. Create a new job",
+    "2. Show all jobs",
+    "3. Save jobs",
+    "4. Exit",
+    BAR
+]) + "\n"
+
+# Spawn settings asked for every job: (key, prompt, default, copy_from).
+# When copy_from names an earlier field, its value is used as the default.
+SPAWN_FIELDS = (
+    ('health', "Health", 100, None),
+    ('max_health', "Max Health", None, 'health'),
+    ('armor', "Armor", 0, None),
+    ('max_armor', "Max Armor (leave empty to match Armor)", None, 'armor'),
+    ('walk_speed', "Walk Speed", 200, None),
+    ('run_speed', "Run Speed", 400, None),
+    ('jump_power', "Jump Power", 200, None)
+)
+
+# str.translate table for Lua string literals: backslash and quote are
+# escaped, other control characters become \ddd decimal escapes
+LUA_ESCAPES = {c: f"\\{c:03d}" for c in (*range(32), 127)}
+LUA_ESCAPES.update({ord("\\"): "\\\\", ord('"'): '\\"'})
+
+# Lua literals for False/True, indexed by the bool itself
+LUA_BOOL = ('false', 'true')
+
+# Start of every saved jobs file, followed by the creation timestamp
+HEADER_PREFIX = "-- DarkRP Jobs generated with Python Script\n-- Created on: "
+
+# Lua job definition, filled in by DarkRPJobGenerator.create_job
+JOB_TEMPLATE = """{team_name} = DarkRP.createJob({job_name}, {{
+    color = {color},
+    model = {models},
+    description = [[{description}]],
+    weapons = {weapons},
+    command = {command},
+    max = {max_players},
+    salary = {salary},
+    admin = 0,
+    vote = {vote_required},
+    hasLicense = {has_license},
+    candemote = {can_demote},
+
+    PlayerSpawn = function(ply)
+        ply:SetHealth({health})
+        ply:SetMaxHealth({max_health})
+        ply:SetArmor({armor})
+        ply:SetMaxArmor({max_armor})
+        ply:SetWalkSpeed({walk_speed})
+        ply:SetRunSpeed({run_speed})
+        ply:SetJumpPower({jump_power})
+    end
+}})"""
+
+def read_line(prompt):
+    """Read one line of input, bypassing input() when stdin is piped"""
+    if not STDIN_PIPED:
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.rstrip("\r\n")
+
+def parse_int(value, min_val, max_val):
+    """Parse an integer within a range, returning None if it is invalid"""
+    digits = value[1:] if value[:1] in ("+", "-") else value
+    if not digits.isdecimal():
+        print("Invalid input, please enter a number!")
+        return None
+    value_int = int(value)
+    if not min_val <= value_int <= max_val:
+        print(f"Value must be between {min_val} and {max_val}!")
+        return None
+    return value_int
+
+def lua_string(value):
+    """Quote a value as a Lua string literal"""
+    return '"' + value.translate(LUA_ESCAPES) + '"'
+
+def lua_table(values):
+    """Format a list of strings as a Lua table"""
+    return "{" + ", ".join(map(lua_string, values)) + "}"
+
+def print_banner(title):
+    """Print a title framed by separator bars in a single write"""
+    sys.stdout.write(f"\n{BAR}\n{title}\n{BAR}\n")
+
 class DarkRPJobGenerator:
     def __init__(self):
         self.jobs = []
@@ -15,7 +119,7 @@ class DarkRPJobGenerator:
     def get_user_input(self, prompt, default=None, required=True):
         """Get user input with optional default value"""
         while True:
-            user_input = input(f"{prompt} [{default}]: " if default else f"{prompt}: ").strip()
+            user_input = read_line(f"{prompt} [{default}]: " if default else f"{prompt}: ").strip()
             if not user_input and default is not None:
                 return default
             if user_input or not required:
@@ -24,25 +128,24 @@ class DarkRPJobGenerator:
     
     def get_validated_int(self, prompt, min_val, max_val, default):
         """Validate integer input within a range"""
+        full_prompt = f"{prompt} [{default}]: "
         while True:
-            value = self.get_user_input(prompt, default)
-            try:
-                value_int = int(value)
-                if min_val <= value_int <= max_val:
-                    return value_int
-                else:
-                    print(f"Value must be between {min_val} and {max_val}!")
-            except ValueError:
-                print("Invalid input, please enter a number!")
+            value_int = parse_int(read_line(full_prompt).strip() or default, min_val, max_val)
+            if value_int is not None:
+                return value_int
     
     def get_color_input(self):
         """Get RGBA color values"""
         print("\n--- Color Settings ---")
-        r = self.get_validated_int("Red (0-255)", 0, 255, "50")
-        g = self.get_validated_int("Green (0-255)", 0, 255, "50")
-        b = self.get_validated_int("Blue (0-255)", 0, 255, "255")
-        a = self.get_validated_int("Alpha (0-255)", 0, 255, "255")
-        return f"Color({r}, {g}, {b}, {a})"
+        while True:
+            values = self.get_user_input("Color as R G B A (0-255 each)", "50 50 255 255")
+            parts = values.replace(",", " ").split()
+            if len(parts) != 4:
+                print("Please enter exactly four values: R G B A!")
+                continue
+            rgba = tuple(parse_int(part, 0, 255) for part in parts)
+            if None not in rgba:
+                return "Color({}, {}, {}, {})".format(*rgba)
     
     def get_models_input(self):
         """Get player models for the job"""
@@ -52,16 +155,15 @@ class DarkRPJobGenerator:
             model = self.get_user_input("Model path (e.g., models/player/urban.mdl)", required=False)
             if not model:
                 if not models:
-                    models.append('"models/player/urban.mdl"')
+                    models.append("models/player/urban.mdl")
                 break
-            models.append(f'"{model}"')
+            models.append(model)
             
             if self.get_user_input("Add another model? (y/n)", "n").lower() != 'y':
                 break
         
-        if len(models) == 1:
-            return models[0]
-        return "{" + ", ".join(models) + "}"
+        # Drop duplicates while keeping the entry order
+        return list(dict.fromkeys(models))
     
     def get_weapons_input(self):
         """Get weapons for the job"""
@@ -71,37 +173,30 @@ class DarkRPJobGenerator:
             weapon = self.get_user_input("Weapon class (e.g., weapon_pistol)", required=False)
             if not weapon:
                 if not weapons:
-                    weapons.append('"weapon_pistol"')
+                    weapons.append("weapon_pistol")
                 break
-            weapons.append(f'"{weapon}"')
+            weapons.append(weapon)
             
             if self.get_user_input("Add another weapon? (y/n)", "n").lower() != 'y':
                 break
         
-        return "{" + ", ".join(weapons) + "}"
+        return list(dict.fromkeys(weapons))
     
     def get_spawn_settings(self):
         """Get spawn settings for the job"""
         print("\n--- Spawn Settings ---")
         settings = {}
         
-        settings['health'] = int(self.get_user_input("Health", "100"))
-        settings['max_health'] = int(self.get_user_input("Max Health", str(settings['health'])))
-        settings['armor'] = int(self.get_user_input("Armor", "0"))
-        # Automatically set max_armor = armor if empty
-        max_armor_input = self.get_user_input("Max Armor (leave empty to match Armor)", str(settings['armor']))
-        settings['max_armor'] = int(max_armor_input) if max_armor_input else settings['armor']
-        settings['walk_speed'] = int(self.get_user_input("Walk Speed", "200"))
-        settings['run_speed'] = int(self.get_user_input("Run Speed", "400"))
-        settings['jump_power'] = int(self.get_user_input("Jump Power", "200"))
+        for key, prompt, default, copy_from in SPAWN_FIELDS:
+            if copy_from:
+                default = settings[copy_from]
+            settings[key] = self.get_validated_int(prompt, 0, INT32_MAX, str(default))
         
         return settings
     
     def create_job(self):
         """Create a new DarkRP job"""
-        print("\n" + "="*50)
-        print("NEW DARKRP JOB")
-        print("="*50)
+        print_banner("NEW DARKRP JOB")
         
         # Basic information
         team_name = self.get_user_input("Team Name (e.g., TEAM_SUPER)", "TEAM_CUSTOM").upper()
@@ -122,8 +217,8 @@ class DarkRPJobGenerator:
         
         # Other settings
         command = self.get_user_input("Chat command", job_name.lower().replace(" ", ""))
-        max_players = int(self.get_user_input("Max Players", "2"))
-        salary = int(self.get_user_input("Salary", "50"))
+        max_players = self.get_validated_int("Max Players", 0, INT32_MAX, "2")
+        salary = self.get_validated_int("Salary", 0, INT32_MAX, "50")
         has_license = self.get_user_input("Has license? (y/n)", "y").lower() == 'y'
         vote_required = self.get_user_input("Vote required? (y/n)", "n").lower() == 'y'
         can_demote = self.get_user_input("Can be demoted? (y/n)", "n").lower() == 'y'
@@ -132,33 +227,28 @@ class DarkRPJobGenerator:
         spawn_settings = self.get_spawn_settings()
         
         # Generate job code
-        job_template = f"""{team_name} = DarkRP.createJob("{job_name}", {{
-    color = {color},
-    model = {models},
-    description = [[{description}]],
-    weapons = {weapons},
-    command = "{command}",
-    max = {max_players},
-    salary = {salary},
-    admin = 0,
-    vote = {str(vote_required).lower()},
-    hasLicense = {str(has_license).lower()},
-    candemote = {str(can_demote).lower()},
-
-    PlayerSpawn = function(ply)
-        ply:SetHealth({spawn_settings['health']})
-        ply:SetMaxHealth({spawn_settings['max_health']})
-        ply:SetArmor({spawn_settings['armor']})
-        ply:SetMaxArmor({spawn_settings['max_armor']})
-        ply:SetWalkSpeed({spawn_settings['walk_speed']})
-        ply:SetRunSpeed({spawn_settings['run_speed']})
-        ply:SetJumpPower({spawn_settings['jump_power']})
-    end
-}})"""
+        job_template = JOB_TEMPLATE.format(
+            team_name=team_name,
+            job_name=lua_string(job_name),
+            color=color,
+            # A single model is written as a plain string, several as a table
+            models=lua_string(models[0]) if len(models) == 1 else lua_table(models),
+            description=description,
+            weapons=lua_table(weapons),
+            command=lua_string(command),
+            max_players=max_players,
+            salary=salary,
+            vote_required=LUA_BOOL[vote_required],
+            has_license=LUA_BOOL[has_license],
+            can_demote=LUA_BOOL[can_demote],
+            **spawn_settings
+        )
         
         self.jobs.append({
             'team_name': team_name,
             'job_name': job_name,
+            'models': models,
+            'weapons': weapons,
             'code': job_template
         })
         
@@ -170,46 +260,36 @@ class DarkRPJobGenerator:
             print("No jobs to save!")
             return
             
-        filename = f"darkrp_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.lua"
+        # Use one timestamp so the filename and header always agree
+        now = datetime.now()
+        filename = f"darkrp_jobs_{now.strftime('%Y%m%d_%H%M%S')}.lua"
         
+        parts = [HEADER_PREFIX + now.strftime('%d.%m.%Y %H:%M:%S') + "\n\n"]
+        parts.extend(job['code'] + "\n\n" for job in self.jobs)
+
+        # Build the whole file in memory and write it in one go
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("-- DarkRP Jobs generated with Python Script\n")
-            f.write("-- Created on: " + datetime.now().strftime('%d.%m.%Y %H:%M:%S') + "\n\n")
-            
-            for job in self.jobs:
-                f.write(job['code'])
-                f.write("\n\n")
+            f.write("".join(parts))
         
         print(f"\n✅ Jobs saved to: {filename}")
     
     def show_menu(self):
         """Show main menu"""
         while True:
-            print("\n" + "="*50)
-            print("DARKRP JOB GENERATOR")
-            print("="*50)
-            print("1. Create a new job")
-            print("2. Show all jobs")
-            print("3. Save jobs")
-            print("4. Exit")
-            print("="*50)
+            sys.stdout.write(MENU)
             
             choice = self.get_user_input("Choose an option", "1")
             
             if choice == "1":
                 job_code = self.create_job()
-                print("\n" + "="*50)
-                print("GENERATED CODE:")
-                print("="*50)
+                print_banner("GENERATED CODE:")
                 print(job_code)
                 
             elif choice == "2":
                 if not self.jobs:
                     print("No jobs created!")
                 else:
-                    print("\n" + "="*50)
-                    print("CREATED JOBS:")
-                    print("="*50)
+                    print_banner("CREATED JOBS:")
                     for i, job in enumerate(self.jobs, 1):
                         print(f"{i}. {job['team_name']} - {job['job_name']}")
                         
@@ -234,9 +314,7 @@ def main():
     
     if generator.get_user_input("Do you want to create a job now? (y/n)", "y").lower() == 'y':
         job_code = generator.create_job()
-        print("\n" + "="*50)
-        print("GENERATED CODE:")
-        print("="*50)
+        print_banner("GENERATED CODE:")
         print(job_code)
         
         if generator.get_user_input("Save the job? (y/n)", "y").lower() == 'y':